@@ -4,6 +4,8 @@ Enhanced with tool integration and proper conversation flow
 """
 
 import json
+import os
+import tempfile
 import time
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -200,7 +202,16 @@ Prevent repetitive responses and ensure progress toward publication."""
                 "error": str(e),
                 "session_id": self.session_id
             }
-    
+        finally:
+            # Always write the final snapshot: the per-message JSONL
+            # only carries messages, while the .json snapshot holds the
+            # decisions/topics metadata and feeds list_sessions and the
+            # session index
+            try:
+                self.save_session()
+            except Exception as e:
+                self.logger.logger.error(f"Error saving session snapshot: {e}")
+
     def _prepare_articles_with_tools(self, max_articles: int) -> List[Dict]:
         """Enhanced article preparation with content processing"""
         self.logger.logger.info(f"Collecting and processing up to {max_articles} articles")
@@ -465,11 +476,18 @@ This article meets our standards and serves our readers. James, please publish i
                     "publication_status": "published"
                 }
                 
+                config.ensure_dirs()
                 filename = f"published_{publication_data['publication_id']}.json"
                 filepath = config.published_dir / filename
-                
-                with open(filepath, 'w') as f:
+
+                # Atomic publish: temp file + rename, so the dashboard
+                # never reads a partially written article
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=config.published_dir, prefix=filename, suffix=".tmp"
+                )
+                with os.fdopen(fd, 'w') as f:
                     json.dump(publication_data, f, indent=2, default=str)
+                os.replace(tmp_path, filepath)
                 
                 self.logger.logger.info(f"Saved published article: {filename}")
         
@@ -497,8 +515,33 @@ This article meets our standards and serves our readers. James, please publish i
     def export_session(self, format: str = "json") -> str:
         """Export session in various formats"""
         return self.logger.export_conversation(format)
+
+    def stream_export_session(self, format: str = "json"):
+        """Yield session export chunks for streaming writes"""
+        return self.logger.iter_export_chunks(format)
     
     def save_session(self) -> str:
         """Save session to file"""
         self.logger.save_conversation()
+
+        # Keep the SQLite session index current so list_sessions can
+        # answer from one query instead of rescanning every file
+        try:
+            from utils import session_index
+
+            filepath = config.conversations_dir / f"conversation_{self.session_id}.json"
+            session_index.index_session(
+                {
+                    "session_id": self.session_id,
+                    "started_at": self.logger.session_metadata["started_at"],
+                    "participants": len(self.logger.session_metadata["participants"]),
+                    "messages": len(self.logger.messages),
+                    "decisions": len(self.logger.session_metadata["decisions"]),
+                    "file_path": filepath
+                },
+                filepath.stat().st_mtime if filepath.exists() else 0.0
+            )
+        except Exception as e:
+            print(f"⚠️ Could not update session index: {e}")
+
         return f"Session saved as conversation_{self.session_id}.json"
\ No newline at end of file
@@ -392,6 +392,7 @@ class ContentProcessor:
         
         # Save locally
         try:
+            config.ensure_dirs()
             filename = f"published_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             filepath = config.published_dir / filename
             
@@ -458,6 +459,7 @@ class ContentProcessor:
             }
             
             # Save to file
+            config.ensure_dirs()
             filename = f"processed_articles_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             filepath = config.scraped_dir / filename
             
@@ -714,6 +716,7 @@ def get_processing_statistics(articles: List[ProcessedArticle]) -> Dict[str, Any
         
         # Save locally
         try:
+            config.ensure_dirs()
             filename = f"published_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             filepath = config.published_dir / filename
             
@@ -5,6 +5,8 @@ Publishes articles to Slack channels via webhooks
 
 import requests
 import json
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import logging
@@ -311,6 +313,93 @@ class SlackPublisher:
                 "error": str(e)
             }
 
+class SlackBatcher:
+    """Coalesces article notifications into batched webhook posts
+
+    One HTTP round-trip to Slack per message is the slowest operation
+    on the conversation path when publishing is enabled. The batcher
+    buffers messages and flushes them as a single payload (one
+    attachment per article) either when max_batch is reached or after
+    batch_ms of quiet, reusing the publisher's persistent Session so
+    the TCP/TLS handshake is paid once.
+    """
+
+    def __init__(self, publisher: Optional[SlackPublisher] = None,
+                 batch_ms: Optional[int] = None,
+                 max_batch: Optional[int] = None):
+        slack_config = config.get_slack_config()
+        self.publisher = publisher or SlackPublisher()
+        self.batch_ms = batch_ms if batch_ms is not None else slack_config["batch_ms"]
+        self.max_batch = max_batch or slack_config["max_batch"]
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def submit(self, message: SlackMessage):
+        """Buffer one message; flushes when the batch fills up"""
+        payload = self.publisher._create_slack_payload(message)
+        flush_now = False
+
+        with self._lock:
+            self._pending.extend(payload["attachments"])
+            if len(self._pending) >= self.max_batch:
+                flush_now = True
+            elif self._timer is None:
+                self._timer = threading.Timer(self.batch_ms / 1000, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+    def flush(self) -> Dict[str, Any]:
+        """Send everything buffered as one webhook post"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            attachments = list(self._pending)
+            self._pending.clear()
+
+        if not attachments:
+            return {"success": True, "message": "Nothing to flush"}
+
+        if not self.publisher.webhook_url:
+            return {
+                "success": False,
+                "error": "No Slack webhook URL configured"
+            }
+
+        try:
+            payload = {
+                "text": f"🚀 *{len(attachments)} new updates* from Techronicle AutoGen",
+                "attachments": attachments,
+                "username": "Techronicle Bot",
+                "icon_emoji": ":newspaper:"
+            }
+
+            response = self.publisher.session.post(
+                self.publisher.webhook_url,
+                json=payload,
+                timeout=30
+            )
+            response.raise_for_status()
+
+            logger.info(f"Published batch of {len(attachments)} to Slack")
+
+            return {
+                "success": True,
+                "message": f"Batch of {len(attachments)} published to Slack",
+                "timestamp": datetime.now().isoformat()
+            }
+
+        except requests.RequestException as e:
+            logger.error(f"Failed to publish Slack batch: {e}")
+            return {
+                "success": False,
+                "error": f"Request failed: {str(e)}"
+            }
+
 # Utility functions for agents
 def publish_to_slack(article_data: Dict[str, Any], webhook_url: Optional[str] = None) -> Dict[str, Any]:
     """Utility function for agents to publish articles to Slack"""
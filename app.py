@@ -0,0 +1,472 @@
+"""
+Techronicle AutoGen - Streamlit Dashboard
+Live view of newsroom editorial meetings with agent cards and metrics
+"""
+
+import re
+import time
+import queue
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from agents.newsroom import TechronicleNewsroom
+from utils.config import config
+
+# Agent display metadata
+AGENTS_INFO = [
+    {"name": "Gary Poussin", "role": "Beat Reporter", "emoji": "📰", "color": "#2196f3",
+     "description": "Hustler mentality, always chasing scoops"},
+    {"name": "Aravind Rajen", "role": "Market Analyst", "emoji": "🔍", "color": "#9c27b0",
+     "description": "PhD economist, data-driven analysis"},
+    {"name": "Tijana Jekic", "role": "Copy Editor", "emoji": "✏️", "color": "#ff9800",
+     "description": "Former Reuters, fact-checking obsessed"},
+    {"name": "Jerin Sojan", "role": "Managing Editor", "emoji": "⚖️", "color": "#4caf50",
+     "description": "WSJ veteran, diplomatic leadership"},
+    {"name": "Aayushi Patel", "role": "Audience Editor", "emoji": "📱", "color": "#e91e63",
+     "description": "BuzzFeed background, growth-focused"},
+    {"name": "James Guerra", "role": "Publishing Manager", "emoji": "🚀", "color": "#8bc34a",
+     "description": "Tech startup experience, distribution"},
+]
+
+# Compiled once - a single linear scan replaces per-keyword substring searches
+_DECISION_RE = re.compile(
+    r"approve|publish|final decision|executive decision|override|green light", re.I
+)
+_URGENT_RE = re.compile(r"breaking|urgent|immediately|scoop|exclusive", re.I)
+
+# How many messages are rendered inline each tick; older ones move into
+# a lazily-materialized expander so per-tick work stays bounded
+MAX_INLINE_MESSAGES = 50
+
+CSS_BLOCK = """
+<style>
+    .main-header {
+        text-align: center;
+        padding: 1rem 0;
+        border-bottom: 2px solid #333;
+        margin-bottom: 1rem;
+    }
+    .agent-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 10px;
+    }
+    .agent-card {
+        border-radius: 10px;
+        padding: 0.8rem;
+        margin-bottom: 0.5rem;
+        background: rgba(255, 255, 255, 0.05);
+        border-left: 4px solid #666;
+    }
+    .message-box {
+        border-radius: 8px;
+        padding: 0.6rem 0.8rem;
+        margin-bottom: 0.4rem;
+        background: rgba(255, 255, 255, 0.04);
+    }
+    .message-decision { border-left: 4px solid #4caf50; }
+    .message-urgent { border-left: 4px solid #f44336; }
+    .message-discussion { border-left: 4px solid #2196f3; }
+    .message-meta {
+        font-size: 0.75rem;
+        color: #999;
+    }
+</style>
+"""
+
+# Injected once per session: scrolls to the conversation anchor only
+# when new messages are actually appended
+SCROLL_SCRIPT = """
+<script>
+    const observer = new MutationObserver(function() {
+        const anchor = document.getElementById('conv-bottom');
+        if (anchor) { anchor.scrollIntoView({behavior: 'smooth'}); }
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+</script>
+"""
+
+# Static part of each agent card, pre-rendered once at import - only the
+# live message count is interpolated per rerun
+_AGENT_CARD_TEMPLATES = {
+    agent["name"]: (
+        f"""<div class="agent-card" style="border-left-color: {agent['color']}">
+        {agent['emoji']} <strong>{agent['name']}</strong><br>
+        <span class="message-meta">{agent['role']}</span><br>
+        <span class="message-meta">{agent['description']}</span><br>
+        Messages: {{msg_count}}
+        </div>"""
+    )
+    for agent in AGENTS_INFO
+}
+
+
+# Session-state defaults; callables are invoked so each session gets a
+# fresh object (lists, current time) instead of sharing module state
+_SESSION_DEFAULTS = {
+    'newsroom': None,
+    'conversation_messages': list,
+    'session_running': False,
+    'session_results': None,
+    'auto_refresh': True,
+    'articles_collected': list,
+    'approved_articles': list,
+    'message_count': 0,
+    'last_update': time.time,
+    'session_status': 'ready',
+    'session_error': None,
+    '_event_q': queue.Queue,
+    '_results_html': None,
+}
+
+
+def initialize_session_state():
+    """Initialize all session state variables"""
+    for key, default in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, default() if callable(default) else default)
+
+
+def get_conversation_messages():
+    """Read the group chat messages directly from the newsroom instance
+
+    Fragments rerun on the ScriptRunner thread, so reading here keeps all
+    session_state access on the UI thread - no monitor thread needed.
+    """
+    newsroom = st.session_state.newsroom
+    if newsroom is not None and hasattr(newsroom, 'group_chat'):
+        return newsroom.group_chat.messages
+    return []
+
+
+def get_agent_message_counts(messages):
+    """Count messages per speaker (first name) in a single pass
+
+    Shared by the agent cards, live metrics and activity chart so the
+    message list is walked once per rerun instead of once per agent.
+    """
+    return Counter((msg.get("name") or "Unknown").split()[0] for msg in messages)
+
+
+def start_newsroom_session(articles_count: int):
+    """Start an editorial session on a background thread"""
+    if st.session_state.session_running:
+        return
+
+    st.session_state.session_running = True
+    st.session_state.session_status = 'running'
+    st.session_state.session_results = None
+    st.session_state.session_error = None
+    st.session_state.conversation_messages = []
+
+    # The background thread must not touch st.session_state (it's bound
+    # to the ScriptRunner thread) - it hands events over this queue and
+    # the fragments apply them on the UI thread.
+    event_q = st.session_state._event_q = queue.Queue()
+
+    def run_session_thread_safe():
+        try:
+            newsroom = TechronicleNewsroom()
+            event_q.put({"type": "newsroom", "data": newsroom})
+            results = newsroom.run_editorial_session(max_articles=articles_count)
+            event_q.put({"type": "done", "data": results})
+        except Exception as e:
+            event_q.put({"type": "error", "data": str(e)})
+
+    session_thread = threading.Thread(target=run_session_thread_safe, daemon=True)
+    session_thread.start()
+
+
+def drain_session_events():
+    """Apply pending session-thread events on the ScriptRunner thread"""
+    event_q = st.session_state._event_q
+    session_finished = False
+
+    while True:
+        try:
+            event = event_q.get_nowait()
+        except queue.Empty:
+            break
+
+        if event["type"] == "newsroom":
+            st.session_state.newsroom = event["data"]
+        elif event["type"] == "done":
+            results = event["data"]
+            st.session_state.session_results = results
+            st.session_state.approved_articles = results.get("approved_articles", [])
+            newsroom = st.session_state.newsroom
+            if newsroom is not None:
+                st.session_state.articles_collected = newsroom.session_state.get(
+                    "articles_collected", [])
+            st.session_state.session_status = 'completed' if results.get("success") else 'failed'
+            st.session_state.session_running = False
+
+            # Results never change after completion - render the
+            # published-articles block once, here on the UI thread
+            if results.get("approved_articles"):
+                lines = ["**📰 Published Articles:**", ""]
+                for article in results["approved_articles"]:
+                    lines.append(f"• **{article['title']}** ({article['source']})")
+                    lines.append(f"  {article['summary'][:150]}...")
+                st.session_state._results_html = "\n".join(lines)
+            session_finished = True
+        elif event["type"] == "error":
+            st.session_state.session_error = event["data"]
+            st.session_state.session_status = 'failed'
+            st.session_state.session_running = False
+            session_finished = True
+
+    # Completion events are drained inside the conversation fragment,
+    # which reruns in isolation - kick a full script run so the results
+    # dashboard, articles section and Start button pick up the new state
+    if session_finished:
+        st.rerun(scope="app")
+
+
+@st.cache_data(show_spinner=False, max_entries=4096)
+def _render_message_html(speaker, content, index, total, now):
+    """Build the HTML for one message (memoized - messages are immutable)
+
+    Returns (html, needs_expander). Cached on (speaker, content, index,
+    total, now) so the keyword scans and string assembly run once per
+    message instead of once per message per rerun. `now` is truncated to
+    the minute by the caller so cache keys stay stable between ticks.
+    """
+    # Classify the message for styling
+    style_class = "message-discussion"
+    if _DECISION_RE.search(content):
+        style_class = "message-decision"
+    elif _URGENT_RE.search(content):
+        style_class = "message-urgent"
+
+    # Approximate timestamp (one message per minute, counting back from now)
+    timestamp = (now - timedelta(minutes=total - index)).strftime("%H:%M:%S")
+
+    display_content = content if len(content) <= 500 else content[:500] + "..."
+
+    html = f"""<div class="message-box {style_class}">
+        <strong>{speaker}</strong>
+        <span class="message-meta">[{timestamp}]</span><br>
+        {display_content}
+        </div>"""
+
+    return html, len(content) > 500
+
+
+@st.fragment(run_every="2s")
+def display_conversation():
+    """Live conversation panel - reruns in isolation on a timer"""
+    st.subheader("💬 Editorial Discussion")
+
+    drain_session_events()
+    messages = get_conversation_messages()
+    if not messages:
+        st.info("No conversation yet - start an editorial meeting!")
+        return
+
+    # One clock read per tick, truncated to the minute so the memoized
+    # renderer isn't invalidated on every rerun
+    now = datetime.now().replace(second=0, microsecond=0)
+    total = len(messages)
+
+    older = messages[:-MAX_INLINE_MESSAGES]
+    recent = messages[-MAX_INLINE_MESSAGES:]
+
+    # Earlier messages go behind an expander whose body isn't rendered
+    # until opened, keeping the hot path O(MAX_INLINE_MESSAGES)
+    if older:
+        with st.expander(f"Show earlier {len(older)} messages"):
+            older_html = [
+                _render_message_html(msg.get("name", "Unknown"),
+                                     msg.get("content", ""), i, total, now)[0]
+                for i, msg in enumerate(older)
+            ]
+            st.markdown("\n".join(older_html), unsafe_allow_html=True)
+
+    # Concatenate everything into one markdown element - one protobuf
+    # delta per tick instead of one per message
+    html_parts = []
+    long_messages = []
+    for i, msg in enumerate(recent, start=len(older)):
+        speaker = msg.get("name", "Unknown")
+        content = msg.get("content", "")
+        html, needs_expander = _render_message_html(speaker, content, i, total, now)
+        html_parts.append(html)
+        if needs_expander:
+            long_messages.append((i, speaker, content))
+
+    # Stable anchor at the bottom - the MutationObserver injected once in
+    # main() scrolls to it when new messages appear
+    html_parts.append('<div id="conv-bottom"></div>')
+    st.markdown("\n".join(html_parts), unsafe_allow_html=True)
+
+    # Real widgets (expanders) only for messages that were truncated
+    for i, speaker, content in long_messages:
+        with st.expander(f"Show full message #{i + 1} from {speaker}"):
+            st.write(content)
+
+
+def display_agent_cards():
+    """Show the newsroom team with live per-agent message counts"""
+    st.subheader("🤖 Newsroom Team")
+
+    agent_counts = get_agent_message_counts(get_conversation_messages())
+
+    # One markdown element for the whole grid - CSS handles the layout
+    cards = [
+        _AGENT_CARD_TEMPLATES[agent["name"]].format(
+            msg_count=agent_counts.get(agent["name"].split()[0], 0)
+        )
+        for agent in AGENTS_INFO
+    ]
+    st.markdown(
+        "<div class='agent-grid'>" + "".join(cards) + "</div>",
+        unsafe_allow_html=True
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_activity_fig(counts_items):
+    """Build the agent-activity bar chart for a given counts snapshot
+
+    Cached on the sorted (agent, count) tuple so unchanged counts skip
+    the DataFrame build, px.bar construction and figure-to-JSON
+    serialization on every tick.
+    """
+    # Deferred imports: plotly/pandas cost ~200ms cold and are only
+    # needed once a chart is actually shown
+    import plotly.express as px
+    import pandas as pd
+
+    df = pd.DataFrame({
+        "Agent": [agent for agent, _ in counts_items],
+        "Messages": [count for _, count in counts_items]
+    })
+    return px.bar(df, x="Agent", y="Messages", title="Agent Activity")
+
+
+@st.fragment(run_every="2s")
+def display_live_metrics():
+    """Live session metrics and agent activity chart"""
+    messages = get_conversation_messages()
+    agent_counts = get_agent_message_counts(messages)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Messages", len(messages))
+    col2.metric("Speakers", len(agent_counts))
+    col3.metric("Status", st.session_state.session_status.title())
+
+    if agent_counts:
+        fig = _build_activity_fig(tuple(sorted(agent_counts.items())))
+        # Static plot: skip Plotly's hover/zoom/pan wiring for the tiny
+        # live chart - the completed-session chart stays interactive
+        st.plotly_chart(
+            fig,
+            use_container_width=True,
+            theme=None,
+            config={"staticPlot": True, "displayModeBar": False}
+        )
+
+
+def display_articles_section():
+    """Show collected articles and approval status"""
+    articles = st.session_state.articles_collected
+    if not articles:
+        return
+
+    st.subheader("📰 Articles Under Discussion")
+    approved_titles = {approved.get('title')
+                       for approved in st.session_state.approved_articles}
+
+    for i, article in enumerate(articles, 1):
+        is_approved = article.get('title') in approved_titles
+        status = "✅ Approved" if is_approved else "🔎 In review"
+        st.write(f"{i}. **{article.get('title', 'Untitled')}** ({article.get('source', '?')}) - {status}")
+
+
+def display_results_dashboard():
+    """Show the completed session's results"""
+    results = st.session_state.session_results
+    if not results:
+        return
+
+    st.subheader("📊 Session Results")
+
+    if results.get("success"):
+        st.success(f"Session {results['session_id']} completed!")
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Articles Discussed", results.get("articles_discussed", 0))
+        col2.metric("Articles Published", results.get("articles_published", 0))
+        col3.metric("Total Messages", results.get("total_messages", 0))
+
+        if st.session_state._results_html:
+            st.markdown(st.session_state._results_html)
+    else:
+        st.error(f"Session failed: {results.get('error', 'Unknown error')}")
+
+
+def main():
+    """Main Streamlit application"""
+    st.set_page_config(
+        page_title="Techronicle AutoGen",
+        page_icon="🗞️",
+        layout="wide"
+    )
+
+    initialize_session_state()
+
+    # The CSS and scroll handler must be re-emitted on every rerun -
+    # Streamlit drops elements that aren't part of the current script
+    # run, so a once-per-session gate loses the styling after the
+    # first widget interaction. The blocks themselves are still built
+    # once at module level.
+    st.markdown(CSS_BLOCK, unsafe_allow_html=True)
+    st.markdown(SCROLL_SCRIPT, unsafe_allow_html=True)
+
+    st.markdown(
+        '<div class="main-header"><h1>🗞️ Techronicle AutoGen</h1>'
+        '<p>Multi-Agent Crypto Newsroom</p></div>',
+        unsafe_allow_html=True
+    )
+
+    # Sidebar controls
+    with st.sidebar:
+        st.header("🎛️ Session Controls")
+
+        if not config.openai_api_key:
+            st.error("OpenAI API key not configured")
+
+        articles_count = st.slider("Articles to discuss", 1, 10, 5)
+
+        if st.button("🚀 Start Editorial Meeting",
+                     disabled=st.session_state.session_running):
+            start_newsroom_session(articles_count)
+
+        if st.session_state.session_running:
+            st.info("Session in progress...")
+
+        st.session_state.auto_refresh = st.checkbox(
+            "Auto-refresh", value=st.session_state.auto_refresh
+        )
+
+    # Main layout
+    display_agent_cards()
+
+    left, right = st.columns([2, 1])
+    with left:
+        display_conversation()
+    with right:
+        display_live_metrics()
+        display_articles_section()
+
+    display_results_dashboard()
+
+    if st.session_state.session_error:
+        st.error(f"💥 {st.session_state.session_error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -731,6 +731,10 @@ function App() {
   // Handle WebSocket messages
   const handleWebSocketMessage = (data) => {
     switch (data.type) {
+      case 'batch':
+        // Server coalesces bursts into one frame; replay in order
+        data.messages.forEach(handleWebSocketMessage);
+        break;
       case 'conversation_history':
         setMessages(data.messages.map(msg => ({ ...msg, id: Math.random().toString(36) })));
         break;
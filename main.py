@@ -6,12 +6,35 @@ Command-line interface for running newsroom sessions
 
 import sys
 import os
+import io
 import time
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+
+try:
+    import orjson  # C-level JSON parser/serializer, ~3-10x stdlib
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # streaming JSON parser - avoids loading whole files
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec  # fixed-slot structs + fast JSON encode
+except ImportError:
+    msgspec = None
+
+try:
+    import aiofiles  # async file I/O - overlaps reads across files
+except ImportError:
+    aiofiles = None
+from typing import Any, Dict, Optional, Tuple
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -20,44 +43,185 @@ from rich.prompt import Prompt, Confirm
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from agents.newsroom import TechronicleNewsroom
+# The newsroom pulls in AutoGen and the full agent stack, which is slow
+# to import - defer it so lightweight commands (version, list_sessions,
+# check_configuration) start instantly
 from utils.config import config
-from utils.logger import get_logger
 
 # Initialize CLI
 app = typer.Typer(help="Techronicle AutoGen - Multi-Agent Crypto News Curation")
 console = Console()
 
-def display_banner():
-    """Display the application banner"""
+def load_json_file(file_path: str) -> Any:
+    """Parse a JSON file, using orjson when available"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def dumps_json(obj: Any) -> str:
+    """Serialize to pretty-printed JSON, using orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+def extract_session_info(file_path: str) -> Dict[str, Any]:
+    """Extract just the listing fields from a conversation file
+
+    The session list only needs a handful of scalars and three array
+    lengths. With ijson available the file is streamed and the messages
+    are counted without ever materializing them; otherwise fall back to
+    a full parse.
+    """
+    if ijson is None:
+        data = load_json_file(file_path)
+        return {
+            "session_id": data["session_metadata"]["session_id"],
+            "started_at": data["session_metadata"]["started_at"],
+            "participants": len(data["session_metadata"]["participants"]),
+            "messages": len(data["messages"]),
+            "decisions": len(data["session_metadata"]["decisions"]),
+            "file_path": file_path
+        }
+
+    info = {
+        "session_id": "Unknown",
+        "started_at": "",
+        "participants": 0,
+        "messages": 0,
+        "decisions": 0,
+        "file_path": file_path
+    }
+
+    with open(file_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "session_metadata.session_id":
+                info["session_id"] = value
+            elif prefix == "session_metadata.started_at":
+                info["started_at"] = value
+            elif prefix == "session_metadata.participants.item":
+                info["participants"] += 1
+            elif prefix == "session_metadata.decisions.item" and event == "start_map":
+                info["decisions"] += 1
+            elif prefix == "messages.item" and event == "start_map":
+                info["messages"] += 1
+
+    return info
+
+def _read_sessions_async(paths):
+    """Read and summarize conversation files on one event loop
+
+    With aiofiles the open/read of every file overlaps on a single
+    thread instead of queueing behind a thread pool. Concurrency is
+    capped so a large archive can't exhaust file descriptors.
+    """
+    import asyncio
+
+    async def _load(path, semaphore):
+        try:
+            async with semaphore:
+                async with aiofiles.open(path, 'rb') as f:
+                    data = await f.read()
+            parsed = orjson.loads(data) if orjson else json.loads(data)
+            return path, {
+                "session_id": parsed["session_metadata"]["session_id"],
+                "started_at": parsed["session_metadata"]["started_at"],
+                "participants": len(parsed["session_metadata"]["participants"]),
+                "messages": len(parsed["messages"]),
+                "decisions": len(parsed["session_metadata"]["decisions"]),
+                "file_path": path
+            }
+        except Exception as e:
+            return path, e
+
+    async def _gather():
+        semaphore = asyncio.Semaphore(64)
+        return await asyncio.gather(*[_load(path, semaphore) for path in paths])
+
+    return asyncio.run(_gather())
+
+if msgspec:
+    class SessionRow(msgspec.Struct):
+        """Fixed-slot record for one row of the session listing"""
+        session_id: str
+        started_at: str
+        participants: int
+        messages: int
+        decisions: int
+        file_path: str
+else:
+    from dataclasses import dataclass
+
+    @dataclass(slots=True)
+    class SessionRow:
+        """Fixed-slot record for one row of the session listing"""
+        session_id: str
+        started_at: str
+        participants: int
+        messages: int
+        decisions: int
+        file_path: str
+
+@functools.lru_cache(maxsize=1)
+def _render_banner() -> str:
+    """Render the banner panel to ANSI text once
+
+    The banner is a constant renderable, so every command after the
+    first reuses the escape-code string instead of re-running Rich's
+    panel layout.
+    """
     banner = """
     ████████╗███████╗ ██████╗██╗  ██╗██████╗  ██████╗ ███╗   ██╗██╗ ██████╗██╗     ███████╗
     ╚══██╔══╝██╔════╝██╔════╝██║  ██║██╔══██╗██╔═══██╗████╗  ██║██║██╔════╝██║     ██╔════╝
-       ██║   █████╗  ██║     ███████║██████╔╝██║   ██║██╔██╗ ██║██║██║     ██║     █████╗  
-       ██║   ██╔══╝  ██║     ██╔══██║██╔══██╗██║   ██║██║╚██╗██║██║██║     ██║     ██╔══╝  
+       ██║   █████╗  ██║     ███████║██████╔╝██║   ██║██╔██╗ ██║██║██║     ██║     █████╗
+       ██║   ██╔══╝  ██║     ██╔══██║██╔══██╗██║   ██║██║╚██╗██║██║██║     ██║     ██╔══╝
        ██║   ███████╗╚██████╗██║  ██║██║  ██║╚██████╔╝██║ ╚████║██║╚██████╗███████╗███████╗
        ╚═╝   ╚══════╝ ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝ ╚═════╝╚══════╝╚══════╝
     """
-    
-    console.print(Panel(
+
+    # Render into a silent in-memory console - a recording Console
+    # still writes to its file (stdout by default), which would print
+    # the banner once here and again when the export is written out
+    recorder = Console(
+        file=io.StringIO(),
+        record=True,
+        force_terminal=console.is_terminal,
+        width=console.width
+    )
+    recorder.print(Panel(
         f"[bold cyan]{banner}[/bold cyan]\n\n"
         "[bold white]Multi-Agent Crypto News Curation System[/bold white]\n"
         "[dim]Powered by AutoGen Framework[/dim]",
         title="🚀 Techronicle AutoGen",
         border_style="cyan"
     ))
+    return recorder.export_text(styles=True)
+
+def display_banner() -> None:
+    """Display the application banner"""
+    sys.stdout.write(_render_banner())
+
+# Each validator pairs a getter with its failure message; adding a check
+# is one tuple entry
+_CONFIG_VALIDATORS = (
+    (lambda: config.openai_api_key, "❌ OpenAI API key not found. Set OPENAI_API_KEY environment variable."),
+    (lambda: config.rss_feeds, "❌ No RSS feeds configured."),
+)
+
+@functools.lru_cache(maxsize=1)
+def _check_configuration_cached() -> Tuple[bool, Tuple[str, ...]]:
+    """Validate configuration once and memoize the result
 
-def check_configuration():
+    interactive re-checks before every session; the answer can't change
+    without a restart, so cache (ok, issues) after the first call.
+    """
+    issues = tuple(message for getter, message in _CONFIG_VALIDATORS if not getter())
+    return (not issues, issues)
+
+def check_configuration() -> bool:
     """Check if the system is properly configured"""
-    issues = []
-    
-    if not config.openai_api_key:
-        issues.append("❌ OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
-    
-    if not config.rss_feeds:
-        issues.append("❌ No RSS feeds configured.")
-    
-    if issues:
+    ok, issues = _check_configuration_cached()
+
+    if not ok:
         console.print(Panel(
             "\n".join(issues) + "\n\n[yellow]Please check your configuration before running.[/yellow]",
             title="⚠️ Configuration Issues",
@@ -68,7 +232,7 @@ def check_configuration():
     console.print("[green]✅ Configuration looks good![/green]")
     return True
 
-def display_team_info():
+def display_team_info() -> None:
     """Display information about the newsroom team"""
     team_table = Table(title="🤖 Newsroom Team")
     team_table.add_column("Agent", style="cyan", no_wrap=True)
@@ -125,6 +289,7 @@ def run(
         ) as progress:
             
             init_task = progress.add_task("Initializing newsroom agents...", total=None)
+            from agents.newsroom import TechronicleNewsroom
             newsroom = TechronicleNewsroom(session_id=session_id)
             progress.update(init_task, completed=True)
             
@@ -135,13 +300,15 @@ def run(
         
         # Display results
         if results["success"]:
-            console.print(f"\n[bold green]🎉 Session Completed Successfully![/bold green]")
-            
+            # Build everything first and render with one console.print -
+            # a single write to the terminal instead of one per line
+            renderables = ["\n[bold green]🎉 Session Completed Successfully![/bold green]"]
+
             # Results summary
             summary_table = Table(title="📊 Session Summary")
             summary_table.add_column("Metric", style="cyan")
             summary_table.add_column("Value", style="green")
-            
+
             summary_table.add_row("Session ID", results["session_id"])
             summary_table.add_row("Articles Discussed", str(results["articles_discussed"]))
             summary_table.add_row("Articles Approved", str(results["articles_approved"]))
@@ -150,25 +317,30 @@ def run(
             summary_table.add_row("Decisions Made", str(len(results["decisions_made"])))
             summary_table.add_row("Participants", str(len(results["participants"])))
             summary_table.add_row("Publication Req. Met", "✅ Yes" if results["publication_requirement_met"] else "❌ No")
-            
-            console.print(summary_table)
-            
-            # Show published articles
+
+            renderables.append(summary_table)
+
+            # Show published articles - one joined string per block so
+            # Rich parses each section once, not once per line
             if results.get("approved_articles"):
-                console.print(f"\n[bold]📰 Published Articles:[/bold]")
-                for i, article in enumerate(results["approved_articles"], 1):
-                    console.print(f"{i}. [green]{article['title']}[/green]")
-                    console.print(f"   Source: {article['source']}")
-                    console.print(f"   Summary: {article['summary'][:100]}...")
-                    console.print()
-            
+                renderables.append("\n[bold]📰 Published Articles:[/bold]\n" + "\n".join(
+                    f"{i}. [green]{article['title']}[/green]\n"
+                    f"   Source: {article['source']}\n"
+                    f"   Summary: {article['summary'][:100]}...\n"
+                    for i, article in enumerate(results["approved_articles"], 1)
+                ))
+
             # Show key decisions
             if results["decisions_made"]:
-                console.print(f"\n[bold]📋 Editorial Decisions:[/bold]")
-                for i, decision in enumerate(results["decisions_made"], 1):
-                    decision_type = "🔴 OVERRIDE" if decision.get("metadata", {}).get("override") else "✅ STANDARD"
-                    console.print(f"{i}. {decision_type} [cyan]{decision['decision_maker']}[/cyan]: {decision['content'][:100]}...")
-            
+                kind = ("✅ STANDARD", "🔴 OVERRIDE").__getitem__
+                renderables.append("\n[bold]📋 Editorial Decisions:[/bold]\n" + "\n".join(
+                    f"{i}. {kind(bool(decision.get('metadata', {}).get('override')))} "
+                    f"[cyan]{decision['decision_maker']}[/cyan]: {decision['content'][:100]}..."
+                    for i, decision in enumerate(results["decisions_made"], 1)
+                ))
+
+            console.print(Group(*renderables))
+
             # Save option
             if save:
                 saved_file = newsroom.save_session()
@@ -177,13 +349,11 @@ def run(
             # Export options
             if interactive and Confirm.ask("\nExport conversation?"):
                 format_choice = Prompt.ask("Export format", choices=["json", "markdown", "text"], default="markdown")
-                
-                export_content = newsroom.export_session(format_choice)
                 export_filename = f"session_{results['session_id']}.{format_choice}"
-                
-                with open(export_filename, 'w') as f:
-                    f.write(export_content)
-                
+
+                with open(export_filename, 'wb', buffering=1 << 20) as f:
+                    f.writelines(chunk.encode('utf-8') for chunk in newsroom.stream_export_session(format_choice))
+
                 console.print(f"[green]📄 Exported to {export_filename}[/green]")
         
         else:
@@ -247,8 +417,16 @@ def config_check():
         ("Published", config.published_dir)
     ]
     
+    # One scandir of the data directory instead of a stat per path
+    # (the directories are created lazily, so data_dir may not exist yet)
+    if config.data_dir.is_dir():
+        with os.scandir(config.data_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    else:
+        existing = set()
+
     for name, path in directories:
-        exists = "✅" if path.exists() else "❌"
+        exists = "✅" if path.name in existing else "❌"
         console.print(f"• {name}: {exists} {path}")
     
     # Settings
@@ -271,6 +449,7 @@ def demo():
     config.rss_feeds = []  # This will force mock articles
     
     try:
+        from agents.newsroom import TechronicleNewsroom
         newsroom = TechronicleNewsroom(session_id=f"demo_{datetime.now().strftime('%H%M%S')}")
         results = newsroom.run_editorial_session(max_articles=3)
         
@@ -342,8 +521,8 @@ def analyze(
         # Export option
         if export:
             export_filename = f"analysis_{session_id}.json"
-            with open(export_filename, 'w') as f:
-                json.dump(summary, f, indent=2, default=str)
+            with open(export_filename, 'wb', buffering=1 << 20) as f:
+                f.write(dumps_json(summary).encode('utf-8'))
             console.print(f"\n[green]📄 Analysis exported to {export_filename}[/green]")
     
     except Exception as e:
@@ -359,57 +538,84 @@ def list_sessions(
     display_banner()
     
     try:
-        import glob
-        
-        # Find session files
-        session_files = glob.glob(str(config.conversations_dir / "conversation_*.json"))
-        session_files.sort(key=os.path.getmtime, reverse=True)  # Most recent first
-        
-        if not session_files:
+        from utils import session_index
+
+        # Fast path: sessions are indexed in SQLite when saved, so
+        # listing is a single query instead of a parse per file
+        sessions_data = session_index.query_sessions(limit)
+
+        if sessions_data is None:
+            # Index missing or stale - scan once and rebuild it. scandir
+            # returns cached stat info with each entry, so sorting by
+            # mtime costs no extra stat() calls the way glob+getmtime did
+            session_entries = []
+            if config.conversations_dir.is_dir():
+                with os.scandir(config.conversations_dir) as entries:
+                    session_entries = [
+                        entry for entry in entries
+                        if entry.is_file()
+                        and entry.name.startswith("conversation_")
+                        and entry.name.endswith(".json")
+                    ]
+            session_entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)  # Most recent first
+            session_files = [entry.path for entry in session_entries]
+
+            # Read files in parallel - the serial open/parse loop was
+            # latency-bound on one disk round-trip per file
+            if aiofiles:
+                raw_sessions = _read_sessions_async(session_files)
+            else:
+                def read_one(file_path):
+                    try:
+                        return file_path, extract_session_info(file_path)
+                    except Exception as e:
+                        return file_path, e
+
+                with ThreadPoolExecutor(max_workers=min(32, max(1, len(session_files) or 1))) as executor:
+                    raw_sessions = list(executor.map(read_one, session_files))
+
+            all_sessions = []
+
+            for file_path, session_info in raw_sessions:
+                if isinstance(session_info, Exception):
+                    console.print(f"[yellow]Warning: Could not read {file_path}: {session_info}[/yellow]")
+                    continue
+
+                all_sessions.append(session_info)
+
+            session_index.index_sessions(all_sessions)
+            sessions_data = all_sessions[:limit]
+
+        if not sessions_data:
             console.print("[yellow]No sessions found[/yellow]")
             return
-        
-        sessions_data = []
-        
-        for file_path in session_files[:limit]:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                # Extract session info
-                session_info = {
-                    "session_id": data["session_metadata"]["session_id"],
-                    "started_at": data["session_metadata"]["started_at"],
-                    "participants": len(data["session_metadata"]["participants"]),
-                    "messages": len(data["messages"]),
-                    "decisions": len(data["session_metadata"]["decisions"]),
-                    "file_path": file_path
-                }
-                sessions_data.append(session_info)
-                
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not read {file_path}: {e}[/yellow]")
-                continue
-        
+
+        # Struct rows are slot-backed, so the render loop does attribute
+        # loads instead of per-key dict hashing
+        rows = [SessionRow(**{**info, "file_path": str(info["file_path"])}) for info in sessions_data]
+
         if format == "json":
-            console.print(json.dumps(sessions_data, indent=2, default=str))
+            if msgspec:
+                console.print(msgspec.json.encode(rows).decode())
+            else:
+                console.print(dumps_json(sessions_data))
         else:
             # Table format
-            sessions_table = Table(title=f"Recent Editorial Sessions (Last {len(sessions_data)})")
+            sessions_table = Table(title=f"Recent Editorial Sessions (Last {len(rows)})")
             sessions_table.add_column("Session ID", style="cyan")
             sessions_table.add_column("Started At", style="green")
             sessions_table.add_column("Participants", justify="center")
             sessions_table.add_column("Messages", justify="center")
             sessions_table.add_column("Decisions", justify="center")
-            
-            for session in sessions_data:
-                started_time = session["started_at"].split("T")[1][:8] if "T" in session["started_at"] else "Unknown"
+
+            for session in rows:
+                started_time = session.started_at.split("T")[1][:8] if "T" in session.started_at else "Unknown"
                 sessions_table.add_row(
-                    session["session_id"],
+                    session.session_id,
                     started_time,
-                    str(session["participants"]),
-                    str(session["messages"]),
-                    str(session["decisions"])
+                    str(session.participants),
+                    str(session.messages),
+                    str(session.decisions)
                 )
             
             console.print(sessions_table)
@@ -436,21 +642,19 @@ def export_session(
             console.print(f"[red]❌ Session {session_id} not found[/red]")
             raise typer.Exit(code=1)
         
-        # Export conversation
-        export_content = logger.export_conversation(format)
-        
         # Determine output file
         if not output:
             extension = {"json": "json", "markdown": "md", "text": "txt"}[format]
             output = f"session_{session_id}.{extension}"
-        
-        # Write to file
-        with open(output, 'w') as f:
-            f.write(export_content)
-        
+
+        # Stream chunks straight to disk instead of buffering the full
+        # export string in memory first
+        with open(output, 'wb', buffering=1 << 20) as f:
+            f.writelines(chunk.encode('utf-8') for chunk in logger.iter_export_chunks(format))
+
         console.print(f"[green]✅ Session exported to {output}[/green]")
         console.print(f"Format: {format}")
-        console.print(f"Size: {len(export_content)} characters")
+        console.print(f"Size: {os.path.getsize(output)} bytes")
     
     except Exception as e:
         console.print(f"[red]❌ Error exporting session: {e}[/red]")
@@ -483,6 +687,7 @@ def interactive():
         console.print(f"\n[bold green]🚀 Starting Interactive Session[/bold green]")
         
         # Initialize newsroom
+        from agents.newsroom import TechronicleNewsroom
         newsroom = TechronicleNewsroom(session_id=session_id)
         
         console.print(f"Session ID: {newsroom.session_id}")
@@ -540,10 +745,10 @@ def interactive():
             if Confirm.ask("Export conversation?"):
                 export_format = Prompt.ask("Export format", choices=["json", "markdown", "text"], default="markdown")
                 export_filename = f"session_{newsroom.session_id}.{export_format}"
-                
-                with open(export_filename, 'w') as f:
-                    f.write(newsroom.export_session(export_format))
-                
+
+                with open(export_filename, 'wb', buffering=1 << 20) as f:
+                    f.writelines(chunk.encode('utf-8') for chunk in newsroom.stream_export_session(export_format))
+
                 console.print(f"[green]📄 Exported to {export_filename}[/green]")
         
         else:
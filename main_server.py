@@ -10,19 +10,50 @@ warnings.filterwarnings("ignore", message=".*API key specified is not a valid Op
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from http.client import HTTPException
 import json
+import re
+import orjson
+
+try:
+    import uvloop  # libuv-backed event loop, 2-4x faster socket I/O
+    asyncio_loop = "uvloop"
+except ImportError:
+    uvloop = None
+    asyncio_loop = "asyncio"
+import functools
 import asyncio
-import threading
+import collections
+import logging
+import logging.handlers
+import queue
 import time
 from datetime import datetime
 from typing import List, Dict, Any
 import uuid
+import atexit
 from pathlib import Path
+from types import MappingProxyType
 import concurrent.futures
 
+if uvloop:
+    # Covers loops created outside uvicorn's runner too
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Hot-path diagnostics go through a queue so the emitting thread never
+# blocks on stderr; a background listener does the actual writes
+_log_queue = queue.SimpleQueue()
+log = logging.getLogger("techronicle.ws")
+if not log.handlers:
+    log.addHandler(logging.handlers.QueueHandler(_log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 # Import your newsroom
 from agents.newsroom import TechronicleNewsroom
 from utils.config import config
@@ -35,7 +66,77 @@ from agents.personalities.jerin_sojan import create_jerin_agent
 from agents.personalities.aayushi_patel import create_aayushi_agent
 from agents.personalities.james_guerra import create_james_agent
 
-app = FastAPI(title="Techronicle AutoGen Live Newsroom")
+# Agent factories are pure and deterministic, so instances (and the
+# response dicts built from them) are created once and cached
+AGENT_CREATORS = {
+    "gary": create_gary_agent,
+    "aravind": create_aravind_agent,
+    "tijana": create_tijana_agent,
+    "jerin": create_jerin_agent,
+    "aayushi": create_aayushi_agent,
+    "james": create_james_agent
+}
+
+# Read-only views: these tables are shared across every request and
+# message, so nothing should be able to mutate them in place
+_AGENT_METADATA = MappingProxyType({
+    "gary": {"full_name": "Gary Poussin", "role": "Beat Reporter", "age": 28, "color": "#2196f3", "emoji": "📰"},
+    "aravind": {"full_name": "Dr. Aravind Rajen", "role": "Senior Market Analyst", "age": 34, "color": "#9c27b0", "emoji": "🔍"},
+    "tijana": {"full_name": "Tijana Jekic", "role": "Copy Editor & Fact Checker", "age": 31, "color": "#ff9800", "emoji": "✏️"},
+    "jerin": {"full_name": "Jerin Sojan", "role": "Managing Editor", "age": 38, "color": "#4caf50", "emoji": "⚖️"},
+    "aayushi": {"full_name": "Aayushi Patel", "role": "Audience Development Editor", "age": 26, "color": "#e91e63", "emoji": "📱"},
+    "james": {"full_name": "James Guerra", "role": "Digital Publishing Manager", "age": 29, "color": "#8bc34a", "emoji": "🚀"}
+})
+
+_AGENT_UI_INFO = MappingProxyType({
+    "Gary": {"designation": "Beat Reporter", "color": "#2196f3", "emoji": "📰"},
+    "Aravind": {"designation": "Market Analyst", "color": "#9c27b0", "emoji": "🔍"},
+    "Tijana": {"designation": "Copy Editor", "color": "#ff9800", "emoji": "✏️"},
+    "Jerin": {"designation": "Managing Editor", "color": "#4caf50", "emoji": "⚖️"},
+    "Aayushi": {"designation": "Audience Editor", "color": "#e91e63", "emoji": "📱"},
+    "James": {"designation": "Publishing Manager", "color": "#8bc34a", "emoji": "🚀"}
+})
+
+_UNKNOWN_UI_INFO = MappingProxyType({
+    "designation": "Team Member",
+    "color": "#757575",
+    "emoji": "🤖"
+})
+
+# Pre-built message skeletons per agent - the hot path copies one and
+# fills in the four per-message fields instead of assembling the whole
+# dict from scratch
+_AGENT_MSG_TEMPLATES = {
+    name: {
+        "speaker": name,
+        "designation": info["designation"],
+        "color": info["color"],
+        "emoji": info["emoji"]
+    }
+    for name, info in _AGENT_UI_INFO.items()
+}
+
+_UNKNOWN_MSG_TEMPLATE = {"speaker": "Unknown", **_UNKNOWN_UI_INFO}
+
+@functools.lru_cache(maxsize=None)
+def _get_agent(agent_key: str):
+    """Create (once) and cache the agent instance for a key"""
+    return AGENT_CREATORS[agent_key]()
+
+def _clear_agent_cache():
+    """Reset cached agents and responses (for tests)"""
+    _get_agent.cache_clear()
+    _build_agents_info.cache_clear()
+    _build_agent_detail.cache_clear()
+    _agents_info_bytes.cache_clear()
+    _agent_detail_bytes.cache_clear()
+
+# orjson encodes every response; static payloads are additionally
+# serialized to bytes once so the hot path is a plain memory copy
+app = FastAPI(
+    title="Techronicle AutoGen Live Newsroom",
+    default_response_class=ORJSONResponse
+)
 
 # Add CORS middleware for React development
 app.add_middleware(
@@ -53,42 +154,118 @@ if react_build_dir.exists():
 
 # WebSocket connections manager (same as before)
 class ConnectionManager:
+    # Clients per gather before yielding back to the loop
+    BROADCAST_CHUNK = 50
+    # Messages retained for reconnect replay
+    HISTORY_MAXLEN = 1000
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Set membership makes disconnect and dead-socket pruning O(1)
+        self.active_connections: set = set()
+        self.sse_queues: List[asyncio.Queue] = []
         self.newsroom_instance = None
         self.session_running = False
-        self.conversation_messages = []
+        # Ring buffer: a marathon session can't grow the history (and
+        # the reconnect replay built from it) without bound
+        self.conversation_messages = collections.deque(maxlen=self.HISTORY_MAXLEN)
+        # Raw messages waiting to be formatted - filled while no client
+        # is listening so headless runs skip the formatting work. Same
+        # bound as the formatted history: a fully headless marathon run
+        # must not grow this without limit either
+        self.pending_raw = collections.deque(maxlen=self.HISTORY_MAXLEN)
+        # Serialized conversation_history frame, rebuilt lazily so N
+        # reconnects share one JSON encode of the backlog
+        self._history_text = None
         self.loop = None
         self.session_start_time = None
         self.step_times = {}
+        # Outbound frames pass through this queue so the flusher can
+        # coalesce bursts into a single batch frame. SimpleQueue is
+        # lock-free on put, so the newsroom thread enqueues without any
+        # event-loop round-trip; the Event wakes the flusher.
+        self._tx_queue = queue.SimpleQueue()
+        self._wakeup = asyncio.Event()
+        self._flusher_task = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         
-        # Send current conversation if available
+        # Send current conversation if available. Text frames keep the
+        # browser client's JSON.parse(event.data) working as-is.
+        _drain_pending()
         if self.conversation_messages:
-            await websocket.send_json({
-                "type": "conversation_history",
-                "messages": self.conversation_messages
-            })
+            if self._history_text is None:
+                self._history_text = orjson.dumps({
+                    "type": "conversation_history",
+                    "messages": list(self.conversation_messages),
+                    "history_truncated": len(self.conversation_messages) == self.HISTORY_MAXLEN
+                }).decode()
+            await websocket.send_text(self._history_text)
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def broadcast(self, message: dict):
-        dead_connections = []
-        for connection in self.active_connections:
+        # Serialize once and flush all sockets concurrently - send_json
+        # re-encoded the dict per connection and awaited them in series
+        if self.active_connections:
+            payload = orjson.dumps(message).decode()
+            connections = list(self.active_connections)
+            dead = []
+
+            # Fan out in chunks and yield between them so a large or
+            # slow client set can't starve the rest of the event loop
+            for i in range(0, len(connections), self.BROADCAST_CHUNK):
+                chunk = connections[i:i + self.BROADCAST_CHUNK]
+                results = await asyncio.gather(
+                    *(connection.send_text(payload) for connection in chunk),
+                    return_exceptions=True
+                )
+                dead.extend(
+                    connection for connection, result in zip(chunk, results)
+                    if isinstance(result, Exception)
+                )
+                await asyncio.sleep(0)
+
+            # Remove dead connections in one sweep
+            if dead:
+                self.active_connections.difference_update(dead)
+
+        # Push to SSE subscribers as well
+        for sse_queue in self.sse_queues:
             try:
-                await connection.send_json(message)
-            except:
-                dead_connections.append(connection)
-        
-        # Remove dead connections
-        for conn in dead_connections:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+                sse_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                pass
+
+    def enqueue(self, message: dict):
+        """Hand a frame to the flusher for coalesced delivery (loop thread)"""
+        self._tx_queue.put_nowait(message)
+        self._wakeup.set()
+
+    async def _flush_outbox(self):
+        """Drain-and-batch consumer for outbound frames
+
+        Sleeps until the wakeup event fires, then sweeps everything
+        queued - so slow traffic flows through untouched while a burst
+        of M messages costs one batch frame instead of M.
+        """
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            batch = []
+            while True:
+                try:
+                    batch.append(self._tx_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if len(batch) == 1:
+                await self.broadcast(batch[0])
+            elif batch:
+                await self.broadcast({"type": "batch", "messages": batch})
 
     async def send_status(self, status: str, details: str = ""):
         message = {
@@ -97,41 +274,66 @@ class ConnectionManager:
             "details": details,
             "timestamp": datetime.now().isoformat()
         }
-        await self.broadcast(message)
+        self.enqueue(message)
 
     def send_status_sync(self, status: str, details: str = ""):
-        """Thread-safe status sending"""
-        if self.loop and not self.loop.is_closed():
-            try:
-                asyncio.run_coroutine_threadsafe(
-                    self.send_status(status, details), 
-                    self.loop
-                ).result(timeout=1.0)
-            except:
-                pass
+        """Thread-safe status sending (fire-and-forget)"""
+        self.broadcast_message_sync({
+            "type": "status_update",
+            "status": status,
+            "details": details,
+            "timestamp": datetime.now().isoformat()
+        })
 
     def broadcast_message_sync(self, message: dict):
-        """Thread-safe message broadcasting"""
+        """Thread-safe message broadcasting (fire-and-forget)
+
+        A lock-free queue put plus one call_soon_threadsafe to set the
+        wakeup event - no coroutine submission, no Future, no waiting.
+        """
         if self.loop and not self.loop.is_closed():
             try:
-                asyncio.run_coroutine_threadsafe(
-                    self.broadcast(message), 
-                    self.loop
-                ).result(timeout=1.0)
+                self._tx_queue.put_nowait(message)
+                self.loop.call_soon_threadsafe(self._wakeup.set)
             except:
                 pass
 
 manager = ConnectionManager()
 
+# One long-lived worker thread for editorial sessions - sessions never
+# overlap, and per-call executors leaked their threads
+_NEWSROOM_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="newsroom"
+)
+# The FastAPI shutdown hook handles the normal path; atexit covers
+# processes that never ran the app (tests, scripts importing this module)
+atexit.register(_NEWSROOM_EXECUTOR.shutdown, wait=False)
+
 @app.on_event("startup")
 async def startup_event():
     """Store the event loop for thread-safe operations"""
-    manager.loop = asyncio.get_event_loop()
+    manager.loop = asyncio.get_running_loop()
+
+    # Eager tasks (3.12+) skip the ready queue for coroutines that
+    # finish without suspending - common for our tiny broadcast tasks
+    if hasattr(asyncio, "eager_task_factory"):
+        manager.loop.set_task_factory(asyncio.eager_task_factory)
+
+    manager._flusher_task = asyncio.create_task(manager._flush_outbox())
+
     print("🚀 FastAPI server started")
     print("📡 WebSocket endpoint: ws://localhost:8000/ws")
     print("🌐 React Frontend: http://localhost:3000 (development)")
     print("🌐 Production Frontend: http://localhost:8000 (when built)")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the session worker thread and the flusher task"""
+    if manager._flusher_task:
+        manager._flusher_task.cancel()
+    _NEWSROOM_EXECUTOR.shutdown(wait=False)
+
 # Serve React app (only for root path)
 @app.get("/")
 async def get_app():
@@ -149,25 +351,15 @@ async def get_app():
             ]
         }
 
-@app.get("/api/agents")
-async def get_agents_info():
-    """Get information about all agents including their system prompts"""
-    
-    agent_creators = {
-        "gary": create_gary_agent,
-        "aravind": create_aravind_agent,
-        "tijana": create_tijana_agent,
-        "jerin": create_jerin_agent,
-        "aayushi": create_aayushi_agent,
-        "james": create_james_agent
-    }
-    
+@functools.lru_cache(maxsize=1)
+def _build_agents_info() -> dict:
+    """Build the /api/agents payload once from cached agents"""
     agents_info = {}
-    
-    for agent_key, creator_func in agent_creators.items():
+
+    for agent_key in AGENT_CREATORS:
         try:
-            agent = creator_func()
-            
+            agent = _get_agent(agent_key)
+
             agents_info[agent_key] = {
                 "name": agent.name,
                 "description": agent.description,
@@ -187,38 +379,26 @@ async def get_agents_info():
                 "max_consecutive_auto_reply": 0,
                 "llm_config": {"model": "unknown", "temperature": 0.7}
             }
-    
+
     return agents_info
 
-@app.get("/api/agent/{agent_key}")
-async def get_agent_info(agent_key: str):
-    """Get detailed information about a specific agent"""
-    
-    agent_creators = {
-        "gary": create_gary_agent,
-        "aravind": create_aravind_agent,
-        "tijana": create_tijana_agent,
-        "jerin": create_jerin_agent,
-        "aayushi": create_aayushi_agent,
-        "james": create_james_agent
-    }
-    
-    if agent_key not in agent_creators:
-        return {"error": f"Agent '{agent_key}' not found"}
-    
+@functools.lru_cache(maxsize=1)
+def _agents_info_bytes() -> bytes:
+    """Pre-serialized /api/agents payload"""
+    return orjson.dumps(_build_agents_info())
+
+@app.get("/api/agents")
+async def get_agents_info():
+    """Get information about all agents including their system prompts"""
+    return Response(content=_agents_info_bytes(), media_type="application/json")
+
+@functools.lru_cache(maxsize=None)
+def _build_agent_detail(agent_key: str) -> dict:
+    """Build the /api/agent/{key} payload once per agent"""
     try:
-        agent = agent_creators[agent_key]()
-        
-        agent_metadata = {
-            "gary": {"full_name": "Gary Poussin", "role": "Beat Reporter", "age": 28, "color": "#2196f3", "emoji": "📰"},
-            "aravind": {"full_name": "Dr. Aravind Rajen", "role": "Senior Market Analyst", "age": 34, "color": "#9c27b0", "emoji": "🔍"},
-            "tijana": {"full_name": "Tijana Jekic", "role": "Copy Editor & Fact Checker", "age": 31, "color": "#ff9800", "emoji": "✏️"},
-            "jerin": {"full_name": "Jerin Sojan", "role": "Managing Editor", "age": 38, "color": "#4caf50", "emoji": "⚖️"},
-            "aayushi": {"full_name": "Aayushi Patel", "role": "Audience Development Editor", "age": 26, "color": "#e91e63", "emoji": "📱"},
-            "james": {"full_name": "James Guerra", "role": "Digital Publishing Manager", "age": 29, "color": "#8bc34a", "emoji": "🚀"}
-        }
-        
-        metadata = agent_metadata.get(agent_key, {
+        agent = _get_agent(agent_key)
+
+        metadata = _AGENT_METADATA.get(agent_key, {
             "full_name": agent_key.title(),
             "role": "Team Member",
             "age": 30,
@@ -242,10 +422,23 @@ async def get_agent_info(agent_key: str):
                 "temperature": agent.llm_config.get("temperature", 0.7)
             }
         }
-        
+
     except Exception as e:
         return {"error": f"Could not load agent '{agent_key}': {str(e)}"}
 
+@functools.lru_cache(maxsize=None)
+def _agent_detail_bytes(agent_key: str) -> bytes:
+    """Pre-serialized /api/agent/{key} payload"""
+    return orjson.dumps(_build_agent_detail(agent_key))
+
+@app.get("/api/agent/{agent_key}")
+async def get_agent_info(agent_key: str):
+    """Get detailed information about a specific agent"""
+    if agent_key not in AGENT_CREATORS:
+        return {"error": f"Agent '{agent_key}' not found"}
+
+    return Response(content=_agent_detail_bytes(agent_key), media_type="application/json")
+
 @app.get("/api/latest-published-article")
 async def get_latest_published_article():
     try:
@@ -270,21 +463,62 @@ async def get_latest_published_article():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load article: {str(e)}")
 
+@app.get("/api/stream")
+async def stream_messages(request: Request):
+    """Stream conversation updates as Server-Sent Events
+
+    Lets browsers receive message deltas without a WebSocket (and without
+    any client-side polling) - each new message is pushed as one SSE frame.
+    """
+    sse_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+    manager.sse_queues.append(sse_queue)
+
+    async def event_stream():
+        try:
+            # Replay existing conversation first, then stream deltas.
+            # Snapshot the deque - new messages can land between the
+            # awaited sends and mutating a deque mid-iteration raises.
+            _drain_pending()
+            for message in list(manager.conversation_messages):
+                yield f"data: {json.dumps(message)}\n\n"
+
+            while True:
+                if await request.is_disconnected():
+                    break
+
+                try:
+                    message = await asyncio.wait_for(sse_queue.get(), timeout=15.0)
+                    yield f"data: {json.dumps(message)}\n\n"
+                except asyncio.TimeoutError:
+                    # Keep-alive comment so proxies don't drop the stream
+                    yield ": keep-alive\n\n"
+        finally:
+            if sse_queue in manager.sse_queues:
+                manager.sse_queues.remove(sse_queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            data = await websocket.receive_json()
-            
+            # orjson parses the frame instead of FastAPI's stdlib json
+            # path; frames stay text so the browser client is untouched
+            data = orjson.loads(await websocket.receive_text())
+
             if data["type"] == "start_session":
                 if not manager.session_running:
                     await start_newsroom_session(data.get("articles_count", 5))
                 else:
-                    await websocket.send_json({
+                    await websocket.send_text(orjson.dumps({
                         "type": "error",
                         "message": "Session already running"
-                    })
+                    }).decode())
             
             elif data["type"] == "stop_session":
                 if manager.session_running:
@@ -300,117 +534,156 @@ async def start_newsroom_session(articles_count: int):
         return
     
     manager.session_running = True
-    manager.conversation_messages = []
+    manager.conversation_messages.clear()
+    manager.pending_raw.clear()
+    manager._history_text = None
     manager.session_start_time = datetime.now()
     manager.step_times = {}
     
     await manager.send_status("initializing", "Setting up editorial meeting...")
-    
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
-    
-    def run_newsroom():
-        try:
-            session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-            manager.newsroom_instance = TechronicleNewsroom(session_id=session_id)
-            
-            manager.send_status_sync("initialized", f"Editorial meeting {session_id} ready")
-            
-            monitor_thread = threading.Thread(target=monitor_conversation, daemon=True)
-            monitor_thread.start()
-            
-            manager.send_status_sync("running", "Editorial discussion in progress...")
-            results = manager.newsroom_instance.run_editorial_session(articles_count)
-            
-            success = results.get("success", False)
-            status = "completed" if success else "failed"
-            details = f"Published {results.get('articles_published', 0)} articles" if success else results.get('error', 'Unknown error')
-            
-            manager.send_status_sync(status, details)
-            manager.session_running = False
-            
-        except Exception as e:
-            manager.send_status_sync("error", f"Session failed: {str(e)}")
-            manager.session_running = False
-    
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(executor, run_newsroom)
 
-def monitor_conversation():
-    """Monitor conversation and broadcast new messages (thread-safe)"""
-    last_message_count = 0
-    
-    while manager.session_running and manager.newsroom_instance:
-        try:
-            if hasattr(manager.newsroom_instance, 'group_chat') and manager.newsroom_instance.group_chat.messages:
-                current_messages = manager.newsroom_instance.group_chat.messages
-                current_count = len(current_messages)
-                
-                if current_count > last_message_count:
-                    new_messages = current_messages[last_message_count:]
-                    
-                    for msg in new_messages:
-                        formatted_message = format_message_for_ui(msg)
-                        manager.conversation_messages.append(formatted_message)
-                        
-                        manager.broadcast_message_sync({
-                            "type": "new_message",
-                            "message": formatted_message
-                        })
-                    
-                    last_message_count = current_count
-            
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"Monitor error: {e}")
-            break
+    # Only the blocking newsroom calls hop to the worker thread; all the
+    # status updates and hook wiring stay straight-line on the loop
+    loop = asyncio.get_running_loop()
+
+    try:
+        # Nanosecond hex id: two sessions in the same second can't
+        # collide the way the old %Y%m%d_%H%M%S ids could
+        session_id = f"{time.time_ns():x}"
+        manager.newsroom_instance = await loop.run_in_executor(
+            _NEWSROOM_EXECUTOR,
+            lambda: TechronicleNewsroom(session_id=session_id)
+        )
+
+        await manager.send_status("initialized", f"Editorial meeting {session_id} ready")
+
+        # Broadcast on append instead of polling from a thread
+        if hasattr(manager.newsroom_instance, 'group_chat'):
+            group_chat = manager.newsroom_instance.group_chat
+            group_chat.messages = _BroadcastingList(group_chat.messages)
 
-def format_message_for_ui(msg: dict) -> dict:
-    """Enhanced message formatting for UI display"""
+        await manager.send_status("running", "Editorial discussion in progress...")
+        results = await loop.run_in_executor(
+            _NEWSROOM_EXECUTOR,
+            lambda: manager.newsroom_instance.run_editorial_session(articles_count)
+        )
+
+        success = results.get("success", False)
+        status = "completed" if success else "failed"
+        details = f"Published {results.get('articles_published', 0)} articles" if success else results.get('error', 'Unknown error')
+
+        await manager.send_status(status, details)
+
+    except Exception as e:
+        await manager.send_status("error", f"Session failed: {str(e)}")
+
+    finally:
+        manager.session_running = False
+
+class _BroadcastingList(list):
+    """group_chat.messages shim that pushes each append to the event loop
+
+    AutoGen appends every chat message to group_chat.messages from the
+    newsroom thread; wrapping the list turns that append into an
+    immediate broadcast instead of waiting up to a second for a polling
+    thread to notice the length change.
+    """
+
+    def append(self, msg):
+        super().append(msg)
+        if manager.loop and not manager.loop.is_closed():
+            manager.loop.call_soon_threadsafe(_on_new_message, msg)
+
+def _drain_pending():
+    """Format raw messages that queued up while nobody was listening"""
+    if manager.pending_raw:
+        pending = list(manager.pending_raw)
+        manager.pending_raw.clear()
+        # One timestamp for the whole backlog - they're all landing now
+        timestamp = _now_iso()
+        manager.conversation_messages.extend(
+            format_message_for_ui(raw, timestamp) for raw in pending
+        )
+        manager._history_text = None
+
+def _on_new_message(msg: dict):
+    """Format and broadcast a freshly appended message (runs on the loop)"""
+    try:
+        # With no consumers there is nothing to push - park the raw
+        # message and format the backlog when someone connects
+        if not manager.active_connections and not manager.sse_queues:
+            manager.pending_raw.append(msg)
+            manager._history_text = None
+            return
+
+        _drain_pending()
+        formatted_message = format_message_for_ui(msg)
+        manager.conversation_messages.append(formatted_message)
+        manager._history_text = None  # history frame is stale now
+
+        manager.enqueue({
+            "type": "new_message",
+            "message": formatted_message
+        })
+
+    except Exception:
+        log.exception("Broadcast error")
+
+# Message timestamps only need second resolution for the UI, so the ISO
+# string is recomputed at most once per second instead of per message
+_last_ts_second = 0
+_last_ts_iso = ""
+
+def _now_iso() -> str:
+    """Cached second-resolution ISO timestamp"""
+    global _last_ts_second, _last_ts_iso
+    now = int(time.time())
+    if now != _last_ts_second:
+        _last_ts_second = now
+        _last_ts_iso = datetime.now().isoformat(timespec="seconds")
+    return _last_ts_iso
+
+# All category keywords fused into one compiled pattern - a single
+# C-level scan classifies the message, with match.lastgroup naming the
+# category. The first keyword found in the text decides; at equal
+# positions the group order (decision > tool > urgent) breaks the tie.
+_CATEGORY_RE = re.compile(
+    r"(?P<decision>decision|approve|publish|override|executive|final call)"
+    r"|(?P<tool>tool|processing|collected|analyzed|scraping|relevance)"
+    r"|(?P<urgent>urgent|breaking|immediately|scoop|alert)",
+    re.IGNORECASE
+)
+
+def format_message_for_ui(msg: dict, timestamp: str = None) -> dict:
+    """Enhanced message formatting for UI display
+
+    Pass a shared timestamp when formatting a whole batch so the clock
+    is read once per batch instead of once per message.
+    """
     speaker = msg.get("name", "Unknown")
     content = msg.get("content", "")
-    
-    agent_info = {
-        "Gary": {"designation": "Beat Reporter", "color": "#2196f3", "emoji": "📰"},
-        "Aravind": {"designation": "Market Analyst", "color": "#9c27b0", "emoji": "🔍"},
-        "Tijana": {"designation": "Copy Editor", "color": "#ff9800", "emoji": "✏️"},
-        "Jerin": {"designation": "Managing Editor", "color": "#4caf50", "emoji": "⚖️"},
-        "Aayushi": {"designation": "Audience Editor", "color": "#e91e63", "emoji": "📱"},
-        "James": {"designation": "Publishing Manager", "color": "#8bc34a", "emoji": "🚀"}
-    }
-    
-    info = agent_info.get(speaker, {
-        "designation": "Team Member",
-        "color": "#757575",
-        "emoji": "🤖"
-    })
-    
-    message_type = "discussion"
-    
-    if any(keyword in content.lower() for keyword in ["decision", "approve", "publish", "override", "executive", "final call"]):
-        message_type = "decision"
-    elif any(keyword in content.lower() for keyword in ["tool", "processing", "collected", "analyzed", "scraping", "relevance"]):
-        message_type = "tool"
-    elif any(keyword in content.lower() for keyword in ["urgent", "breaking", "immediately", "scoop", "alert"]):
-        message_type = "urgent"
-    
-    return {
-        "id": str(uuid.uuid4()),
-        "speaker": speaker,
-        "content": content,
-        "timestamp": datetime.now().isoformat(),
-        "designation": info["designation"],
-        "color": info["color"],
-        "emoji": info["emoji"],
-        "message_type": message_type
-    }
+
+    match = _CATEGORY_RE.search(content)
+
+    template = _AGENT_MSG_TEMPLATES.get(speaker)
+    if template is None:
+        formatted = dict(_UNKNOWN_MSG_TEMPLATE, speaker=speaker)
+    else:
+        formatted = template.copy()
+
+    formatted["id"] = uuid.uuid4().hex
+    formatted["content"] = content
+    formatted["timestamp"] = timestamp or _now_iso()
+    formatted["message_type"] = match.lastgroup if match else "discussion"
+
+    return formatted
 
 @app.get("/api/status")
 async def get_status():
     """Get current session status"""
     return {
         "session_running": manager.session_running,
-        "message_count": len(manager.conversation_messages),
+        "message_count": len(manager.conversation_messages) + len(manager.pending_raw),
         "has_newsroom": manager.newsroom_instance is not None,
         "api_key_configured": bool(config.openai_api_key),
         "session_start_time": manager.session_start_time.isoformat() if manager.session_start_time else None
@@ -470,8 +743,10 @@ if __name__ == "__main__":
         print("✅ OpenAI API key configured")
     
     uvicorn.run(
-        app, 
-        host="0.0.0.0", 
+        app,
+        host="0.0.0.0",
         port=8000,
+        loop=asyncio_loop,
+        ws="websockets",
         log_level="info"
     )
\ No newline at end of file
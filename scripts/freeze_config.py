@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Freeze the environment-derived configuration for production deploys
+
+Writes utils/_frozen_config.py with the resolved settings as literals.
+When that module exists, utils/config.py imports it instead of loading
+.env and scanning os.environ, which removes dotenv parsing from every
+cold start - worthwhile for short-lived CLI invocations and container
+images where the environment is fixed at build time.
+
+Usage:
+    python scripts/freeze_config.py
+
+Delete utils/_frozen_config.py to go back to live .env loading.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Make the project importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+
+# Only the keys NewsroomConfig actually reads are frozen - freezing the
+# whole environment would leak unrelated variables into the image
+CONFIG_KEYS = (
+    "OPENAI_API_KEY",
+    "OPENAI_MODEL",
+    "SERPER_API_KEY",
+    "BRAVE_SEARCH_API_KEY",
+    "SLACK_WEBHOOK_URL",
+    "SLACK_ENABLE",
+    "SLACK_BATCH_MS",
+    "SLACK_MAX_BATCH",
+    "SCRAPING_ENABLED",
+    "SCRAPING_DELAY_MIN",
+    "SCRAPING_DELAY_MAX",
+    "SCRAPING_TIMEOUT",
+    "PAYWALL_DETECTION",
+    "MIN_CRYPTO_RELEVANCE",
+    "MIN_WORD_COUNT",
+    "MAX_ARTICLES_TO_SCRAPE",
+    "MAX_ARTICLES_PER_SESSION",
+    "CONVERSATION_TIMEOUT",
+    "MAX_ROUNDS",
+    "LOG_LEVEL",
+    "SAVE_CONVERSATIONS",
+    "SAVE_ARTICLES",
+    "SAVE_SCRAPED_CONTENT",
+    "STREAMLIT_PORT",
+    "AUTO_REFRESH_INTERVAL",
+    "RSS_FEEDS",
+)
+
+def freeze():
+    """Resolve the current environment and write the frozen module"""
+    load_dotenv()
+    frozen = {key: os.environ[key] for key in CONFIG_KEYS if key in os.environ}
+
+    target = Path(__file__).parent.parent / "utils" / "_frozen_config.py"
+    with open(target, 'w') as f:
+        f.write('"""\n')
+        f.write('Generated by scripts/freeze_config.py - do not edit\n')
+        f.write('\n')
+        f.write('Delete this file to restore live .env loading.\n')
+        f.write('"""\n\n')
+        f.write('FROZEN_ENV = {\n')
+        for key in sorted(frozen):
+            f.write(f'    {key!r}: {frozen[key]!r},\n')
+        f.write('}\n')
+
+    print(f"✅ Froze {len(frozen)} settings to {target}")
+    print("💡 Rebuild or redeploy to pick up environment changes")
+
+if __name__ == "__main__":
+    freeze()
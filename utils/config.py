@@ -3,45 +3,73 @@ Configuration management for Techronicle AutoGen
 Updated with web scraping and Slack integration
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import List, Optional
-from dotenv import load_dotenv
 from dataclasses import dataclass
 
-# Load environment variables
-load_dotenv()
+# Snapshot the environment once - field defaults below read this plain
+# dict through typed helpers instead of hitting os.getenv and repeating
+# the lower()/int()/float() coercion pattern thirty times. In frozen
+# deployments (scripts/freeze_config.py) the snapshot ships as a module
+# of literals and dotenv never loads at all.
+try:
+    from utils._frozen_config import FROZEN_ENV as _ENV
+except ImportError:
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+    _ENV = dict(os.environ)
+
+def _env_str(key: str, default: str = "") -> str:
+    return _ENV.get(key, default)
+
+def _env_opt(key: str) -> Optional[str]:
+    return _ENV.get(key)
+
+def _env_bool(key: str, default: str = "false") -> bool:
+    return _ENV.get(key, default).lower() == "true"
+
+def _env_int(key: str, default: str) -> int:
+    return int(_ENV.get(key, default))
+
+def _env_float(key: str, default: str) -> float:
+    return float(_ENV.get(key, default))
 
 @dataclass
 class NewsroomConfig:
     """Configuration for the newsroom application"""
     
     # API Configuration
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
-    openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4-1106-preview")
-    serper_api_key: Optional[str] = os.getenv("SERPER_API_KEY")
-    brave_search_api_key: Optional[str] = os.getenv("BRAVE_SEARCH_API_KEY")
-    
+    openai_api_key: str = _env_str("OPENAI_API_KEY")
+    openai_model: str = _env_str("OPENAI_MODEL", "gpt-4-1106-preview")
+    serper_api_key: Optional[str] = _env_opt("SERPER_API_KEY")
+    brave_search_api_key: Optional[str] = _env_opt("BRAVE_SEARCH_API_KEY")
+
     # Slack Integration
-    slack_webhook_url: Optional[str] = os.getenv("SLACK_WEBHOOK_URL")
-    slack_enable: bool = os.getenv("SLACK_ENABLE", "false").lower() == "true"
-    
+    slack_webhook_url: Optional[str] = _env_opt("SLACK_WEBHOOK_URL")
+    slack_enable: bool = _env_bool("SLACK_ENABLE", "false")
+    slack_batch_ms: int = _env_int("SLACK_BATCH_MS", "500")
+    slack_max_batch: int = _env_int("SLACK_MAX_BATCH", "20")
+
     # Web Scraping Settings
-    scraping_enabled: bool = os.getenv("SCRAPING_ENABLED", "true").lower() == "true"
-    scraping_delay_min: float = float(os.getenv("SCRAPING_DELAY_MIN", "1.0"))
-    scraping_delay_max: float = float(os.getenv("SCRAPING_DELAY_MAX", "3.0"))
-    scraping_timeout: int = int(os.getenv("SCRAPING_TIMEOUT", "30"))
-    paywall_detection: bool = os.getenv("PAYWALL_DETECTION", "true").lower() == "true"
-    
+    scraping_enabled: bool = _env_bool("SCRAPING_ENABLED", "true")
+    scraping_delay_min: float = _env_float("SCRAPING_DELAY_MIN", "1.0")
+    scraping_delay_max: float = _env_float("SCRAPING_DELAY_MAX", "3.0")
+    scraping_timeout: int = _env_int("SCRAPING_TIMEOUT", "30")
+    paywall_detection: bool = _env_bool("PAYWALL_DETECTION", "true")
+
     # Content Processing
-    min_crypto_relevance: float = float(os.getenv("MIN_CRYPTO_RELEVANCE", "0.4"))
-    min_word_count: int = int(os.getenv("MIN_WORD_COUNT", "100"))
-    max_articles_to_scrape: int = int(os.getenv("MAX_ARTICLES_TO_SCRAPE", "10"))
-    
+    min_crypto_relevance: float = _env_float("MIN_CRYPTO_RELEVANCE", "0.4")
+    min_word_count: int = _env_int("MIN_WORD_COUNT", "100")
+    max_articles_to_scrape: int = _env_int("MAX_ARTICLES_TO_SCRAPE", "10")
+
     # Newsroom Settings
-    max_articles_per_session: int = int(os.getenv("MAX_ARTICLES_PER_SESSION", "5"))
-    conversation_timeout: int = int(os.getenv("CONVERSATION_TIMEOUT", "300"))
-    max_rounds: int = int(os.getenv("MAX_ROUNDS", "20"))
+    max_articles_per_session: int = _env_int("MAX_ARTICLES_PER_SESSION", "5")
+    conversation_timeout: int = _env_int("CONVERSATION_TIMEOUT", "300")
+    max_rounds: int = _env_int("MAX_ROUNDS", "20")
     
     # RSS Feeds
     rss_feeds: List[str] = None
@@ -56,20 +84,20 @@ class NewsroomConfig:
     scraped_dir: Path = data_dir / "scraped"
     
     # Logging
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    save_conversations: bool = os.getenv("SAVE_CONVERSATIONS", "true").lower() == "true"
-    save_articles: bool = os.getenv("SAVE_ARTICLES", "true").lower() == "true"
-    save_scraped_content: bool = os.getenv("SAVE_SCRAPED_CONTENT", "true").lower() == "true"
-    
+    log_level: str = _env_str("LOG_LEVEL", "INFO")
+    save_conversations: bool = _env_bool("SAVE_CONVERSATIONS", "true")
+    save_articles: bool = _env_bool("SAVE_ARTICLES", "true")
+    save_scraped_content: bool = _env_bool("SAVE_SCRAPED_CONTENT", "true")
+
     # Streamlit
-    streamlit_port: int = int(os.getenv("STREAMLIT_PORT", "8501"))
-    auto_refresh_interval: int = int(os.getenv("AUTO_REFRESH_INTERVAL", "2"))
+    streamlit_port: int = _env_int("STREAMLIT_PORT", "8501")
+    auto_refresh_interval: int = _env_int("AUTO_REFRESH_INTERVAL", "2")
     
     def __post_init__(self):
         """Initialize after creation"""
         # Set default RSS feeds if not provided
         if self.rss_feeds is None:
-            feeds_env = os.getenv("RSS_FEEDS", "")
+            feeds_env = _env_str("RSS_FEEDS")
             if feeds_env:
                 self.rss_feeds = [feed.strip() for feed in feeds_env.split(",")]
             else:
@@ -81,12 +109,26 @@ class NewsroomConfig:
                     "https://www.crypto-news-flash.com/feed/"
                 ]
         
-        # Create directories if they don't exist
-        for directory in [self.data_dir, self.conversations_dir, 
-                         self.articles_dir, self.decisions_dir, 
+        # Directories are created lazily by ensure_dirs() so that merely
+        # importing the config never touches the filesystem
+        self._dirs_ready = False
+
+    def ensure_dirs(self):
+        """Create the data directories if they don't exist yet
+
+        Called by anything about to write under data_dir. Guarded so
+        repeated calls on hot paths cost a single attribute check.
+        """
+        if self._dirs_ready:
+            return
+
+        for directory in [self.data_dir, self.conversations_dir,
+                         self.articles_dir, self.decisions_dir,
                          self.published_dir, self.scraped_dir]:
             directory.mkdir(parents=True, exist_ok=True)
-    
+        self._dirs_ready = True
+
+
     def validate(self) -> bool:
         """Validate configuration"""
         if not self.openai_api_key:
@@ -120,18 +162,43 @@ class NewsroomConfig:
         """Get Slack configuration"""
         return {
             "enabled": self.slack_enable,
-            "webhook_url": self.slack_webhook_url
+            "webhook_url": self.slack_webhook_url,
+            "batch_ms": self.slack_batch_ms,
+            "max_batch": self.slack_max_batch
         }
 
-# Global configuration instance
-config = NewsroomConfig()
+# Global configuration instance, constructed lazily on first access so
+# `import utils.config` itself does no work
+@functools.lru_cache(maxsize=1)
+def get_config() -> NewsroomConfig:
+    """Get the shared NewsroomConfig instance (built on first call)"""
+    return NewsroomConfig()
+
+def __getattr__(name: str):
+    # Keep `from utils.config import config` working without paying for
+    # construction at module import time (PEP 562)
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # AutoGen LLM configuration
-def get_llm_config(temperature: float = 0.8) -> dict:
-    """Get LLM configuration for AutoGen agents"""
-    return {
-        "model": config.openai_model,
-        "api_key": config.openai_api_key,
+def get_llm_config(temperature: float = 0.8,
+                   cache_seed: Optional[int] = None) -> dict:
+    """Get LLM configuration for AutoGen agents
+
+    cache_seed enables AutoGen's disk-backed response cache: replies
+    are stored under .cache keyed by (seed, prompt, model), so
+    re-running the same conversation with the same seed skips the API
+    entirely. Pass an int to pin a cache, or leave None to use
+    AutoGen's default seed.
+    """
+    cfg = get_config()
+    llm_config = {
+        "model": cfg.openai_model,
+        "api_key": cfg.openai_api_key,
         "temperature": temperature,
         "timeout": 120,
-    }
\ No newline at end of file
+    }
+    if cache_seed is not None:
+        llm_config["cache_seed"] = cache_seed
+    return llm_config
\ No newline at end of file
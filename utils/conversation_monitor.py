@@ -3,8 +3,7 @@ Real-time conversation monitoring for Streamlit interface
 """
 
 import threading
-import time
-import queue
+from collections import deque
 from typing import Dict, List, Any, Callable, Optional
 from datetime import datetime
 import streamlit as st
@@ -13,12 +12,33 @@ class ConversationMonitor:
     """Monitors AutoGen conversations and provides real-time updates"""
     
     def __init__(self):
-        self.message_queue = queue.Queue()
+        # deque + one lock instead of queue.Queue - the Streamlit poll
+        # drains everything in a single lock acquisition rather than
+        # paying a lock round-trip per get_nowait()
+        self._msgs: deque = deque()
+        self._lock = threading.Lock()
         self.is_monitoring = False
         self.monitor_thread = None
         self.callbacks = []
         self.current_messages = []
-        
+        self._wakeup = threading.Event()
+
+    def on_message(self, msg: Dict):
+        """Push a new message into the monitor (call from a message hook)
+
+        Preferred over the fallback polling thread - messages reach the
+        queue immediately instead of waiting for the next poll cycle.
+        """
+        message = {
+            "type": "new_message",
+            "data": msg,
+            "timestamp": datetime.now().isoformat()
+        }
+        with self._lock:
+            self._msgs.append(message)
+        self.trigger_callbacks(message)
+        self._wakeup.set()
+
     def start_monitoring(self, newsroom_instance):
         """Start monitoring a newsroom conversation"""
         if self.is_monitoring:
@@ -37,52 +57,56 @@ class ConversationMonitor:
     def stop_monitoring(self):
         """Stop monitoring"""
         self.is_monitoring = False
+        self._wakeup.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1)
-    
+
     def _monitor_conversation(self):
-        """Monitor conversation in background thread"""
+        """Fallback monitor thread for newsrooms without a message hook
+
+        Blocks on an event instead of a fixed 1s sleep - on_message()
+        wakes it immediately, and the 5s timeout only covers producers
+        that never call the hook.
+        """
         last_message_count = 0
-        
+
         while self.is_monitoring:
             try:
                 if hasattr(self.newsroom, 'group_chat') and self.newsroom.group_chat.messages:
                     current_count = len(self.newsroom.group_chat.messages)
-                    
+
                     if current_count > last_message_count:
                         # New messages detected
                         new_messages = self.newsroom.group_chat.messages[last_message_count:]
-                        
-                        for msg in new_messages:
-                            self.message_queue.put({
-                                "type": "new_message",
-                                "data": msg,
-                                "timestamp": datetime.now().isoformat()
-                            })
-                        
+
+                        items = [{
+                            "type": "new_message",
+                            "data": msg,
+                            "timestamp": datetime.now().isoformat()
+                        } for msg in new_messages]
+                        with self._lock:
+                            self._msgs.extend(items)
+
                         last_message_count = current_count
-                
-                time.sleep(1)  # Check every second
-                
+
+                self._wakeup.wait(timeout=5)
+                self._wakeup.clear()
+
             except Exception as e:
-                self.message_queue.put({
-                    "type": "error",
-                    "data": str(e),
-                    "timestamp": datetime.now().isoformat()
-                })
+                with self._lock:
+                    self._msgs.append({
+                        "type": "error",
+                        "data": str(e),
+                        "timestamp": datetime.now().isoformat()
+                    })
                 break
-    
+
     def get_new_messages(self) -> List[Dict]:
-        """Get new messages from the queue"""
-        new_messages = []
-        
-        try:
-            while True:
-                message = self.message_queue.get_nowait()
-                new_messages.append(message)
-        except queue.Empty:
-            pass
-        
+        """Drain all pending messages in one shot"""
+        with self._lock:
+            new_messages = list(self._msgs)
+            self._msgs.clear()
+
         return new_messages
     
     def add_callback(self, callback: Callable):
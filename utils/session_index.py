@@ -0,0 +1,148 @@
+"""
+SQLite index over saved conversation sessions
+
+Keeps list_sessions from reparsing every conversation JSON file on each
+invocation - sessions are indexed when saved and listed with one query.
+"""
+
+import os
+import sqlite3
+from typing import Dict, List, Optional
+
+from utils.config import config
+
+INDEX_FILENAME = "index.sqlite"
+
+def _index_path():
+    return config.conversations_dir / INDEX_FILENAME
+
+def _connect() -> sqlite3.Connection:
+    """Open (and if needed initialize) the index database"""
+    config.ensure_dirs()
+    conn = sqlite3.connect(_index_path())
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            started_at TEXT,
+            participants INTEGER,
+            messages INTEGER,
+            decisions INTEGER,
+            file_path TEXT,
+            mtime REAL
+        )
+    """)
+    return conn
+
+def index_exists() -> bool:
+    """Check whether the index database has been built"""
+    return _index_path().exists()
+
+def index_session(session_info: Dict, mtime: float):
+    """Insert or update one session's row in the index"""
+    with _connect() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO sessions "
+            "(session_id, started_at, participants, messages, decisions, file_path, mtime) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                session_info["session_id"],
+                session_info["started_at"],
+                session_info["participants"],
+                session_info["messages"],
+                session_info["decisions"],
+                str(session_info["file_path"]),
+                mtime
+            )
+        )
+
+def index_sessions(session_infos: List[Dict]):
+    """Bulk-index sessions (used when building the index from a scan)"""
+    with _connect() as conn:
+        for session_info in session_infos:
+            try:
+                mtime = os.path.getmtime(session_info["file_path"])
+            except OSError:
+                mtime = 0.0
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions "
+                "(session_id, started_at, participants, messages, decisions, file_path, mtime) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    session_info["session_id"],
+                    session_info["started_at"],
+                    session_info["participants"],
+                    session_info["messages"],
+                    session_info["decisions"],
+                    str(session_info["file_path"]),
+                    mtime
+                )
+            )
+
+def _scan_snapshots() -> Dict[str, float]:
+    """Map conversation snapshot paths to mtimes with one scandir"""
+    snapshots = {}
+    if config.conversations_dir.is_dir():
+        with os.scandir(config.conversations_dir) as entries:
+            for entry in entries:
+                if (entry.is_file()
+                        and entry.name.startswith("conversation_")
+                        and entry.name.endswith(".json")):
+                    snapshots[entry.path] = entry.stat().st_mtime
+    return snapshots
+
+def query_sessions(limit: int = 10) -> Optional[List[Dict]]:
+    """Return the most recent sessions from the index, newest first
+
+    Returns None when the index hasn't been built yet - or has gone
+    stale - so callers can fall back to scanning the conversations
+    directory (which rebuilds it). The stored mtimes are checked
+    against one cheap scandir: rows for deleted files are pruned in
+    place, while snapshots that are new or changed on disk trigger
+    the rebuild fallback.
+    """
+    if not index_exists():
+        return None
+
+    snapshots = _scan_snapshots()
+
+    with _connect() as conn:
+        indexed = {
+            row[0]: row[1]
+            for row in conn.execute("SELECT file_path, mtime FROM sessions")
+        }
+
+        # Prune ghost rows whose snapshot files no longer exist
+        stale = [path for path in indexed if path not in snapshots]
+        if stale:
+            conn.executemany(
+                "DELETE FROM sessions WHERE file_path = ?",
+                [(path,) for path in stale]
+            )
+            for path in stale:
+                del indexed[path]
+
+        # Anything new or rewritten since indexing means we're out of
+        # date - let the scan fallback reparse and rebuild
+        for path, mtime in snapshots.items():
+            if path not in indexed or mtime - indexed[path] > 1e-6:
+                return None
+
+        rows = conn.execute(
+            "SELECT session_id, started_at, participants, messages, decisions, file_path "
+            "FROM sessions ORDER BY mtime DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+
+    return [
+        {
+            "session_id": row[0],
+            "started_at": row[1],
+            "participants": row[2],
+            "messages": row[3],
+            "decisions": row[4],
+            "file_path": row[5]
+        }
+        for row in rows
+    ]